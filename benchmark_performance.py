@@ -52,9 +52,9 @@ def benchmark_original_vs_optimized():
     print(f"Performance improvement: {first_init_time/(subsequent_init_time/(num_iterations-1)):.1f}x faster")
     
     print("\nFunctionality Test:")
-    print(f"Core Symbol: {profile['Core']}")
-    print(f"Personality Symbols: {profile['Personality']}")
-    print(f"Role Symbol: {profile['Role']}")
+    print(f"Core Symbol: {profile.Core}")
+    print(f"Personality Symbols: {profile.Personality}")
+    print(f"Role Symbol: {profile.Role}")
     
     return first_init_time, subsequent_init_time
 
@@ -1,4 +1,439 @@
+import hashlib
 import json
+import marshal
+import mmap
+import os
+import pickle
+import weakref
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# NumPy and Numba are only needed by the batch APIs and take far longer to
+# import than the rest of the module, so they are imported on first use.
+np = None
+_profile_soa_kernel = None
+_prange = range
+
+
+def _import_numpy(feature):
+    """Imports NumPy on first use.
+
+    Args:
+        feature (str): The name of the method that needs NumPy, used in the
+            error message.
+
+    Returns:
+        module: The numpy module.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("{} requires numpy".format(feature)) from None
+        np = numpy
+    return np
+
+
+def _load_json(path):
+    """Loads and parses a JSON file, preferring orjson when it is installed.
+
+    With orjson, the file is memory-mapped and parsed in place rather than
+    first being copied into a ``bytes`` object.
+
+    Args:
+        path (str): The path to the JSON file.
+
+    Returns:
+        dict: The parsed JSON data.
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files and some file systems cannot be mapped.
+                return orjson.loads(f.read())
+            with mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+# Mappings from character attributes to symbol names used by the profiler.
+_TRAIT_MAP = {
+    "Brave": "Triangle",
+    "Wise": "Spiral",
+    "Mysterious": "Wave",
+    "Compassionate": "Circle",
+    "Leader": "Angle",
+}
+
+_ROLE_MAP = {
+    "Warrior": "SwordSymbol",
+    "Mage": "StarSymbol",
+}
+
+_NAME_MAP = {
+    "Star": "StarSymbol",
+    "Sun": "SunSymbol",
+}
+
+
+class AstrologicalProfile(NamedTuple):
+    """The astrological part of a character profile."""
+    Sign: Optional[str]
+    Element: Optional[str]
+    Modality: Optional[str]
+
+
+_UNKNOWN_ZODIAC = AstrologicalProfile("Unknown", "Unknown", "Unknown")
+
+# Upper bound on the number of memoized profiles kept per profiler.
+_PROFILE_CACHE_SIZE = 4096
+
+# Integer codes for the structure-of-arrays batch API. Code 0 stands for any
+# origin, role or name meaning that has no symbol of its own.
+_ORIGIN_IDS = {"Celestial": 1}
+_ROLE_IDS = {role: i for i, role in enumerate(_ROLE_MAP, 1)}
+_NAME_IDS = {meaning: i for i, meaning in enumerate(_NAME_MAP, 1)}
+_TRAIT_BITS = {trait: 1 << i for i, trait in enumerate(_TRAIT_MAP)}
+
+
+def _trait_mask(traits):
+    """Encodes personality traits as a bitmask of known traits.
+
+    Args:
+        traits (iterable): The personality trait names.
+
+    Returns:
+        int: The bitmask, ignoring unknown traits.
+    """
+    bits = _TRAIT_BITS
+    mask = 0
+    for trait in traits:
+        mask |= bits.get(trait, 0)
+    return mask
+
+
+def _profile_soa_vectorized(origin_ids, role_ids, name_ids, trait_masks,
+                            origin_lut, role_lut, name_lut, brave_bit, brave_id, valid_mask):
+    """Profiles a batch of integer-encoded characters with NumPy.
+
+    All id arguments must already be valid indexes into the lookup tables.
+
+    Args:
+        origin_ids (numpy.ndarray): The origin code of each character.
+        role_ids (numpy.ndarray): The role code of each character.
+        name_ids (numpy.ndarray): The name meaning code of each character.
+        trait_masks (numpy.ndarray): The personality trait bitmask of each
+            character.
+        origin_lut (numpy.ndarray): The core symbol id of each origin code.
+        role_lut (numpy.ndarray): The role symbol id of each role code.
+        name_lut (numpy.ndarray): The name symbol id of each name meaning code.
+        brave_bit (int): The bit of the Brave trait in the trait masks.
+        brave_id (int): The core symbol id used for Brave characters.
+        valid_mask (int): The bits of the traits that have a personality
+            symbol.
+
+    Returns:
+        tuple: The core symbol ids, personality trait masks, role symbol ids
+            and name symbol ids, one entry per character.
+    """
+    core = np.where(trait_masks & brave_bit, np.int32(brave_id), origin_lut[origin_ids])
+    return core, trait_masks & valid_mask, role_lut[role_ids], name_lut[name_ids]
+
+
+def _profile_soa_loop(origin_ids, role_ids, name_ids, trait_masks,
+                      origin_lut, role_lut, name_lut, brave_bit, brave_id, valid_mask):
+    """Loop equivalent of `_profile_soa_vectorized`, compiled with Numba.
+
+    It takes the same arguments and returns the same arrays as
+    `_profile_soa_vectorized`.
+    """
+    n = origin_ids.shape[0]
+    core = np.empty(n, np.int32)
+    personality = np.empty(n, np.int32)
+    role = np.empty(n, np.int32)
+    name = np.empty(n, np.int32)
+    for i in _prange(n):
+        if trait_masks[i] & brave_bit:
+            core[i] = brave_id
+        else:
+            core[i] = origin_lut[origin_ids[i]]
+        personality[i] = trait_masks[i] & valid_mask
+        role[i] = role_lut[role_ids[i]]
+        name[i] = name_lut[name_ids[i]]
+    return core, personality, role, name
+
+
+def _get_soa_kernel():
+    """Returns the batch profiling kernel, building it on first use.
+
+    The kernel is `_profile_soa_loop` compiled with Numba when it is
+    installed, and `_profile_soa_vectorized` otherwise.
+    """
+    global _profile_soa_kernel, _prange
+    if _profile_soa_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _profile_soa_kernel = _profile_soa_vectorized
+        else:
+            _prange = numba.prange
+            _profile_soa_kernel = numba.njit(parallel=True)(_profile_soa_loop)
+    return _profile_soa_kernel
+
+
+_SIDECAR_SUFFIX = '.cache.pkl'
+
+
+def _source_stamp(symbology_file):
+    """Returns the modification time in nanoseconds and size of a file.
+
+    Args:
+        symbology_file (str): The path to the JSON symbology file.
+
+    Returns:
+        tuple: The ``(st_mtime_ns, st_size)`` pair of the file.
+    """
+    st = os.stat(symbology_file)
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_sidecar(symbology_file, source_stamp):
+    """Reads the parsed symbology from its pickle sidecar, if it is fresh.
+
+    The sidecar is only used if it was written by the same extraction code
+    for a source with exactly the given modification time and size. It
+    lives next to the symbology file and is trusted to the same degree,
+    since unpickling it can execute arbitrary code.
+
+    Args:
+        symbology_file (str): The path to the JSON symbology file.
+        source_stamp (tuple): The `_source_stamp` of the symbology file.
+
+    Returns:
+        tuple: A ``(symbology, symbols)`` pair, or None if there is no usable
+            sidecar.
+    """
+    cache_path = symbology_file + _SIDECAR_SUFFIX
+    try:
+        with open(cache_path, 'rb') as f:
+            version, stamp, symbology, symbols = pickle.load(f)
+    except Exception:
+        # A missing, unreadable or corrupt sidecar is just a cache miss.
+        return None
+    if version != _SIDECAR_VERSION or stamp != source_stamp:
+        return None
+    return symbology, symbols
+
+
+def _write_sidecar(symbology_file, source_stamp, symbology, symbols):
+    """Writes the parsed symbology to a pickle sidecar next to the source.
+
+    Failures are ignored so that read-only locations still work, just
+    without the cross-process cache.
+
+    Args:
+        symbology_file (str): The path to the JSON symbology file.
+        source_stamp (tuple): The `_source_stamp` of the symbology file,
+            taken before it was parsed.
+        symbology (dict): The parsed symbology data.
+        symbols (dict): The symbols extracted from the symbology data.
+    """
+    cache_path = symbology_file + _SIDECAR_SUFFIX
+    tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((_SIDECAR_VERSION, source_stamp, symbology, symbols), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+class _CacheEntry:
+    """Wraps a cached value so the class-level caches can hold it weakly."""
+    __slots__ = ("data", "__weakref__")
+
+    def __init__(self, data):
+        self.data = data
+
+
+@dataclass(frozen=True)
+class CharacterProfile:
+    """An immutable symbolic profile of a character.
+
+    Attributes:
+        Core (str): The core symbol.
+        Personality (tuple): The personality symbols, in trait order.
+        Role (str): The role symbol.
+        Astrology (AstrologicalProfile): The zodiac sign with its element and
+            modality.
+        Name (str): The name symbol.
+        Symbolic_Representation (str): The combined representation, or None
+            if it was not requested.
+    """
+    __slots__ = ("Core", "Personality", "Role", "Astrology", "Name",
+                 "Symbolic_Representation")
+    Core: Optional[str]
+    Personality: Tuple[str, ...]
+    Role: Optional[str]
+    Astrology: AstrologicalProfile
+    Name: Optional[str]
+    Symbolic_Representation: Optional[str]
+
+    def as_dict(self):
+        """Returns the profile as a dictionary.
+
+        This is the profile format returned by earlier versions of
+        `CharacterProfiler.profile_character`.
+
+        Returns:
+            dict: A dictionary representing the character's symbolic profile.
+        """
+        return {
+            "Core": self.Core,
+            "Personality": list(self.Personality),
+            "Role": self.Role,
+            "Astrology": self.Astrology._asdict(),
+            "Name": self.Name,
+            "Symbolic_Representation": self.Symbolic_Representation
+        }
+
+    # Frozen dataclasses with __slots__ cannot be restored by pickle or copy,
+    # which assign the fields one by one, so restore them the way
+    # dataclass(slots=True) does on Python 3.10+.
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+class _LookupTables:
+    """Lookup tables derived from the symbols of a symbology file.
+
+    They only depend on the extracted symbols, so they are built once per
+    symbology file and shared by every profiler of that file.
+    """
+    __slots__ = ("valid_trait_map", "zodiac_profile", "role_symbols", "unknown_role_symbol",
+                 "name_symbols", "default_name_symbol", "symbol_names", "symbol_ids",
+                 "brave_id", "valid_trait_mask", "trait_symbols_by_bit", "origin_lut",
+                 "role_lut", "name_lut", "soa_luts", "profile", "__weakref__")
+
+    def __init__(self, symbols):
+        """Builds the lookup tables for a dictionary of extracted symbols.
+
+        Args:
+            symbols (dict): The symbols extracted from the symbology data.
+        """
+        self.valid_trait_map = {trait: symbol for trait, symbol in _TRAIT_MAP.items()
+                                if symbol in symbols}
+        self.zodiac_profile = {name: AstrologicalProfile(name, sign.get("element"), sign.get("modality"))
+                               for name, sign in symbols["zodiac"].items()}
+
+        self.unknown_role_symbol = symbols.get("UnknownRole", {"name": "UnknownRole"}).get("name")
+        self.role_symbols = {role: symbols.get(symbol, {"name": "UnknownRole"}).get("name")
+                             for role, symbol in _ROLE_MAP.items()}
+        self.default_name_symbol = symbols.get(
+            "DefaultNameSymbol", {"name": "DefaultNameSymbol"}).get("name")
+        self.name_symbols = {meaning: symbols.get(symbol, {"name": "DefaultNameSymbol"}).get("name")
+                             for meaning, symbol in _NAME_MAP.items()}
+
+        # Integer lookup tables for profile_characters_soa.
+        core_symbols = [symbols.get("Point", {}).get("name"),
+                        symbols.get("Circle", {}).get("name")]
+        brave_symbol = symbols.get("Triangle", {}).get("name")
+        role_symbols = [self.unknown_role_symbol, *self.role_symbols.values()]
+        name_symbols = [self.default_name_symbol, *self.name_symbols.values()]
+        self.symbol_names = list(dict.fromkeys(
+            [*core_symbols, brave_symbol, *role_symbols, *name_symbols]))
+        self.symbol_ids = {name: i for i, name in enumerate(self.symbol_names)}
+        self.brave_id = self.symbol_ids[brave_symbol]
+        self.valid_trait_mask = _trait_mask(self.valid_trait_map)
+        self.trait_symbols_by_bit = [self.valid_trait_map.get(trait) for trait in _TRAIT_BITS]
+        ids = self.symbol_ids
+        self.origin_lut = [ids[s] for s in core_symbols]
+        self.role_lut = [ids[s] for s in role_symbols]
+        self.name_lut = [ids[s] for s in name_symbols]
+        self.soa_luts = None
+        self.profile = self._build_profile_function(symbols)
+
+    def _build_profile_function(self, symbols):
+        """Builds a profiling function specialized to these tables.
+
+        The function holds all of the profiling rules: the core symbol comes
+        from a Brave trait, then a Celestial origin, then defaults to Point;
+        traits, roles, zodiac signs and name meanings are looked up in the
+        precomputed tables. The tables are bound as default arguments so that
+        the hot loop reads them as local variables instead of attributes of
+        the profiler.
+
+        Args:
+            symbols (dict): The symbols extracted from the symbology data.
+
+        Returns:
+            function: A function taking ``(characters, include_representation)``
+                and returning a list of CharacterProfile objects.
+        """
+        def profile(characters, include_representation,
+                    trait_map=self.valid_trait_map,
+                    zodiac_profile=self.zodiac_profile,
+                    role_symbols=self.role_symbols,
+                    unknown_role=self.unknown_role_symbol,
+                    name_symbols=self.name_symbols,
+                    default_name=self.default_name_symbol,
+                    brave_symbol=symbols.get("Triangle", {}).get("name"),
+                    celestial_symbol=symbols.get("Circle", {}).get("name"),
+                    default_symbol=symbols.get("Point", {}).get("name"),
+                    unknown_zodiac=_UNKNOWN_ZODIAC,
+                    make_profile=CharacterProfile):
+            profiles = []
+            append = profiles.append
+            for character_data in characters:
+                traits = character_data.get("PersonalityTraits", [])
+                if "Brave" in traits:
+                    core_symbol = brave_symbol
+                elif character_data.get("Origin") == "Celestial":
+                    core_symbol = celestial_symbol
+                else:
+                    core_symbol = default_symbol
+                personality_symbols = [trait_map[trait] for trait in traits if trait in trait_map]
+                role_symbol = role_symbols.get(character_data.get("Role"), unknown_role)
+                astrological_profile = zodiac_profile.get(
+                    character_data.get("AstrologicalData", {}).get("ZodiacSign"), unknown_zodiac)
+                name_symbol = name_symbols.get(
+                    character_data.get("NameData", {}).get("NameMeaning"), default_name)
+
+                # Combine symbols based on grammar
+                # This is a simplified representation of the final output
+                representation = None
+                if include_representation:
+                    representation = "".join((
+                        "Encapsulate(Superimpose(", str(core_symbol), ", ",
+                        str(personality_symbols), "), ", str(role_symbol), ") AdjacentTo(",
+                        str(astrological_profile.Element), ", ", str(astrological_profile.Modality),
+                        ") Enclose(", str(name_symbol), ")"))
+
+                append(make_profile(core_symbol, tuple(personality_symbols), role_symbol,
+                                    astrological_profile, name_symbol, representation))
+            return profiles
+
+        return profile
 
 
 class CharacterProfiler:
@@ -12,26 +447,96 @@ class CharacterProfiler:
         symbology (dict): The loaded symbology data from the JSON file.
         symbols (dict): A simplified dictionary of symbols extracted from the
             symbology data.
+
+    Parsed symbology files are cached at class level. The caches hold their
+    entries weakly, so a file's data is freed once no profiler uses it, but
+    the entries of the most recently created profiler are also kept alive so
+    that short-lived profilers of the same file do not reload it each time.
     """
-    _symbology_cache = {}
-    _symbols_cache = {}
+    _symbology_cache = weakref.WeakValueDictionary()
+    _symbols_cache = weakref.WeakValueDictionary()
+    _sections_cache = weakref.WeakValueDictionary()
+    _tables_cache = weakref.WeakValueDictionary()
+    _recent_entries = ()
+    __slots__ = ("_symbology_entry", "_sections_entry", "_symbols_entry", "_tables",
+                 "symbology", "symbols", "_sections_by_name", "_profile_cache",
+                 "_profile_fast")
     
     def __init__(self, symbology_file):
         """Initializes the CharacterProfiler with a symbology file.
 
+        Parsed data is cached per process in the class-level caches for as
+        long as any profiler of the same file is alive or the file is the
+        most recently profiled one, and across processes
+        in a ``.cache.pkl`` sidecar next to the symbology file, which is
+        reused for as long as the source keeps the same modification time
+        and size.
+
         Args:
             symbology_file (str): The path to the JSON symbology file.
         """
-        if symbology_file not in self._symbology_cache:
-            with open(symbology_file, 'r') as f:
-                self._symbology_cache[symbology_file] = json.load(f)
+        source_stamp = None
+        try:
+            self._symbology_entry = self._symbology_cache[symbology_file]
+        except KeyError:
+            # Stat the source before reading it, so that a concurrent edit
+            # leaves a stale stamp rather than a sidecar that looks fresh.
+            source_stamp = _source_stamp(symbology_file)
+            cached = _read_sidecar(symbology_file, source_stamp)
+            if cached is not None:
+                symbology, symbols = cached
+                self._symbols_entry = self._symbols_cache[symbology_file] = _CacheEntry(symbols)
+                self._tables_cache.pop(symbology_file, None)
+            else:
+                symbology = _load_json(symbology_file)
+            self._symbology_entry = self._symbology_cache[symbology_file] = _CacheEntry(symbology)
+            # A reloaded symbology invalidates any index of the previous one.
+            self._sections_cache.pop(symbology_file, None)
+        
+        self.symbology = self._symbology_entry.data
+        
+        try:
+            self._sections_entry = self._sections_cache[symbology_file]
+        except KeyError:
+            self._sections_entry = self._sections_cache[symbology_file] = _CacheEntry(
+                self._index_sections())
+        
+        self._sections_by_name = self._sections_entry.data
+        
+        try:
+            self._symbols_entry = self._symbols_cache[symbology_file]
+        except KeyError:
+            self._symbols_entry = self._symbols_cache[symbology_file] = _CacheEntry(
+                self._extract_symbols())
+            self._tables_cache.pop(symbology_file, None)
+            if source_stamp is not None:
+                _write_sidecar(symbology_file, source_stamp, self.symbology,
+                               self._symbols_entry.data)
         
-        self.symbology = self._symbology_cache[symbology_file]
+        self.symbols = self._symbols_entry.data
         
-        if symbology_file not in self._symbols_cache:
-            self._symbols_cache[symbology_file] = self._extract_symbols()
+        try:
+            self._tables = self._tables_cache[symbology_file]
+        except KeyError:
+            self._tables = self._tables_cache[symbology_file] = _LookupTables(self.symbols)
         
-        self.symbols = self._symbols_cache[symbology_file]
+        self._profile_fast = self._tables.profile
+        self._profile_cache = {}
+        CharacterProfiler._recent_entries = (self._symbology_entry, self._sections_entry,
+                                             self._symbols_entry, self._tables)
+
+    def _index_sections(self):
+        """Builds an index of the symbology sections by name.
+
+        When several sections share a name, the first one wins.
+
+        Returns:
+            dict: A dictionary mapping section names to section data.
+        """
+        sections = {}
+        for section in self.symbology.get("hasSection", []):
+            sections.setdefault(section.get("name"), section)
+        return sections
 
     def _find_section(self, section_name):
         """Finds a section by name in the symbology data.
@@ -42,10 +547,7 @@ class CharacterProfiler:
         Returns:
             dict: The section data, or None if not found.
         """
-        for section in self.symbology.get("hasSection", []):
-            if section.get("name") == section_name:
-                return section
-        return None
+        return self._sections_by_name.get(section_name)
 
     def _extract_symbols(self):
         """Parses the JSON-LD structure to extract a dictionary of symbols.
@@ -62,22 +564,31 @@ class CharacterProfiler:
         if not framework:
             return symbols
 
+        # Extract Elements
+        def extract_elements(concept_group):
+            for element in concept_group.get("hasElement", []):
+                symbols[element["name"]] = element
+
+        # Extract Modalities
+        def extract_modalities(concept_group):
+            for modality in concept_group.get("hasModality", []):
+                # We store the main modality type (Cardinal, Fixed, Mutable)
+                symbols[modality["modalityType"]] = modality
+
+        # Extract Zodiac Signs
+        def extract_zodiac(concept_group):
+            for sign in concept_group.get("hasZodiacSign", []):
+                symbols["zodiac"][sign["name"]] = sign
+
+        handlers = {
+            "ElementGroup": extract_elements,
+            "ModalityGroup": extract_modalities,
+            "AstrologicalIntegration": extract_zodiac,
+        }
         for concept_group in framework.get("hasConcept", []):
-            # Extract Elements
-            if concept_group.get("@type") == "ElementGroup":
-                for element in concept_group.get("hasElement", []):
-                    symbols[element["name"]] = element
-
-            # Extract Modalities
-            if concept_group.get("@type") == "ModalityGroup":
-                for modality in concept_group.get("hasModality", []):
-                    # We store the main modality type (Cardinal, Fixed, Mutable)
-                    symbols[modality["modalityType"]] = modality
-
-            # Extract Zodiac Signs
-            if concept_group.get("@type") == "AstrologicalIntegration":
-                for sign in concept_group.get("hasZodiacSign", []):
-                    symbols["zodiac"][sign["name"]] = sign
+            handler = handlers.get(concept_group.get("@type"))
+            if handler is not None:
+                handler(concept_group)
 
         # Base symbols are mentioned in multiple places, we can add them manually
         # or parse from duality groups. For now, a manual addition is simpler.
@@ -98,133 +609,222 @@ class CharacterProfiler:
 
         return symbols
 
-    def profile_character(self, character_data):
+    def profile_character(self, character_data, include_representation=True):
         """Generates a symbolic profile for a character.
 
         This method takes a dictionary of character data and returns a symbolic
-        profile based on the rules defined in the class.
+        profile based on the rules defined in the class. Profiles are
+        memoized on the fields that determine them, so characters sharing an
+        archetype are only profiled once.
 
         Args:
             character_data (dict): A dictionary containing character data.
+            include_representation (bool): Whether to build the combined
+                "Symbolic_Representation" string. When False, it is None,
+                which saves most of the cost of profiling.
 
         Returns:
-            dict: A dictionary representing the character's symbolic profile.
+            CharacterProfile: The character's symbolic profile. Use
+                `CharacterProfile.as_dict` for the dictionary form.
         """
-        core_symbol = self._determine_core_symbol(character_data)
-        personality_symbols = self._determine_personality_symbols(character_data)
-        role_symbol = self._determine_role_symbol(character_data)
-        astrological_profile = self._determine_astrological_profile(character_data)
-        name_symbol = self._determine_name_symbol(character_data)
-
-        # Combine symbols based on grammar
-        # This is a simplified representation of the final output
-        profile = {
-            "Core": core_symbol,
-            "Personality": personality_symbols,
-            "Role": role_symbol,
-            "Astrology": astrological_profile,
-            "Name": name_symbol,
-            "Symbolic_Representation": f"Encapsulate(Superimpose({core_symbol}, {personality_symbols}), {role_symbol}) AdjacentTo({astrological_profile['Element']}, {astrological_profile['Modality']}) Enclose({name_symbol})"
-        }
-
+        traits = character_data.get("PersonalityTraits", ())
+        if type(traits) is not list and type(traits) is not tuple:
+            # Other containers, such as strings, can match traits differently
+            # from their tuple form, so they are not memoized.
+            return self._profile_fast((character_data,), include_representation)[0]
+        key = (character_data.get("Origin"),
+               character_data.get("Role"),
+               tuple(traits),
+               character_data.get("AstrologicalData", {}).get("ZodiacSign"),
+               character_data.get("NameData", {}).get("NameMeaning"),
+               include_representation)
+        try:
+            profile = self._profile_cache.get(key)
+        except TypeError:
+            # Unhashable field values cannot be memoized.
+            return self._profile_fast((character_data,), include_representation)[0]
+        if profile is None:
+            profile = self._profile_fast((character_data,), include_representation)[0]
+            if len(self._profile_cache) < _PROFILE_CACHE_SIZE:
+                self._profile_cache[key] = profile
         return profile
 
-    def _determine_core_symbol(self, character_data):
-        """Determines the core symbol based on primary traits or origin.
+    def profile_characters(self, characters, include_representation=True):
+        """Generates symbolic profiles for a batch of characters.
+
+        This is equivalent to calling `profile_character` on each character,
+        but runs in a single specialized loop and skips the memoization,
+        which only pays off for repeated characters.
 
         Args:
-            character_data (dict): A dictionary containing character data.
+            characters (list): A list of character data dictionaries.
+            include_representation (bool): Whether to build the combined
+                "Symbolic_Representation" strings (see `profile_character`).
 
         Returns:
-            str: The name of the core symbol.
+            list: A list of CharacterProfile objects, in input order.
         """
-        traits = character_data.get("PersonalityTraits", [])
-        if "Brave" in traits:
-            return self.symbols.get("Triangle", {}).get("name")
-        if character_data.get("Origin") == "Celestial":
-            return self.symbols.get("Circle", {}).get("name")
-        # Default to Point for existence
-        return self.symbols.get("Point", {}).get("name")
+        return self._profile_fast(characters, include_representation)
 
-    def _determine_personality_symbols(self, character_data):
-        """Determines personality symbols from a list of traits.
+    def profile_characters_soa(self, origin_ids, role_ids, name_ids, trait_masks):
+        """Profiles a batch of integer-encoded characters.
+
+        This is the fastest way to profile very large batches: the characters
+        are given as parallel arrays and the profiling loop is compiled with
+        Numba when it is installed, or vectorized with NumPy otherwise.
+        Requires NumPy.
+
+        Origins, roles and name meanings are encoded as their 1-based position
+        in the profiler's mappings, with 0 for anything unmapped. Personality
+        traits are encoded as a bitmask with one bit per known trait. Use
+        `encode_batch` to encode character data dictionaries.
 
         Args:
-            character_data (dict): A dictionary containing character data.
+            origin_ids (array_like): The origin code of each character.
+            role_ids (array_like): The role code of each character.
+            name_ids (array_like): The name meaning code of each character.
+            trait_masks (array_like): The personality trait bitmask of each
+                character.
+
+        Returns:
+            dict: Arrays of symbol ids under "Core", "Role" and "Name" (see
+                `decode_symbols`), and the bitmask of traits that have a
+                personality symbol under "Personality".
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If the arrays differ in length or contain unknown codes
+                or trait bits.
+        """
+        np = _import_numpy("profile_characters_soa")
+        tables = self._tables
+        if tables.soa_luts is None:
+            tables.soa_luts = tuple(np.array(lut, np.int32) for lut in
+                                    (tables.origin_lut, tables.role_lut, tables.name_lut))
+        origin_lut, role_lut, name_lut = tables.soa_luts
+        origin_ids = self._check_codes(origin_ids, len(origin_lut), "origin_ids")
+        role_ids = self._check_codes(role_ids, len(role_lut), "role_ids")
+        name_ids = self._check_codes(name_ids, len(name_lut), "name_ids")
+        trait_masks = self._check_codes(trait_masks, 1 << len(_TRAIT_BITS), "trait_masks")
+        if not len(origin_ids) == len(role_ids) == len(name_ids) == len(trait_masks):
+            raise ValueError("all input arrays must have the same length")
+
+        core, personality, role, name = _get_soa_kernel()(
+            origin_ids, role_ids, name_ids, trait_masks,
+            origin_lut, role_lut, name_lut,
+            _TRAIT_BITS["Brave"], tables.brave_id,
+            tables.valid_trait_mask)
+        return {"Core": core, "Personality": personality, "Role": role, "Name": name}
+
+    def encode_batch(self, characters):
+        """Encodes character data as parallel integer arrays.
+
+        Requires NumPy.
+
+        Args:
+            characters (list): A list of character data dictionaries.
 
         Returns:
-            list: A list of personality symbol names.
+            dict: int32 arrays under "origin_id", "role_id", "name_id" and
+                "trait_mask", in the encoding expected by
+                `profile_characters_soa`.
+
+        Raises:
+            ImportError: If NumPy is not installed.
         """
-        trait_map = {
-            "Brave": "Triangle",
-            "Wise": "Spiral",
-            "Mysterious": "Wave",
-            "Compassionate": "Circle",
-            "Leader": "Angle",
+        np = _import_numpy("encode_batch")
+        n = len(characters)
+        return {
+            "origin_id": np.fromiter(
+                (_ORIGIN_IDS.get(c.get("Origin"), 0) for c in characters), np.int32, n),
+            "role_id": np.fromiter(
+                (_ROLE_IDS.get(c.get("Role"), 0) for c in characters), np.int32, n),
+            "name_id": np.fromiter(
+                (_NAME_IDS.get(c.get("NameData", {}).get("NameMeaning"), 0) for c in characters),
+                np.int32, n),
+            "trait_mask": np.fromiter(
+                (_trait_mask(c.get("PersonalityTraits", ())) for c in characters), np.int32, n),
         }
-        traits = character_data.get("PersonalityTraits", [])
-        return [trait_map[trait] for trait in traits 
-                if trait in trait_map and trait_map[trait] in self.symbols]
 
-    def _determine_role_symbol(self, character_data):
-        """Determines the role symbol for the character.
+    def score_batch(self, encoded):
+        """Profiles a batch of characters encoded by `encode_batch`.
 
         Args:
-            character_data (dict): A dictionary containing character data.
+            encoded (dict): The arrays returned by `encode_batch`.
 
         Returns:
-            str: The name of the role symbol.
+            dict: The symbol id and personality mask arrays, as returned by
+                `profile_characters_soa`.
         """
-        role_map = {
-            "Warrior": "SwordSymbol",
-            "Mage": "StarSymbol",
-        }
-        role = character_data.get("Role")
-        symbol_name = role_map.get(role, "UnknownRole")
-        return self.symbols.get(symbol_name, {"name": "UnknownRole"}).get("name")
+        return self.profile_characters_soa(encoded["origin_id"], encoded["role_id"],
+                                           encoded["name_id"], encoded["trait_mask"])
 
-    def _determine_astrological_profile(self, character_data):
-        """Looks up the character's zodiac sign and returns its profile.
+    @staticmethod
+    def _check_codes(codes, size, argument):
+        """Checks that codes are integers in range and converts them to int32.
 
-        The profile includes the sign's element and modality.
+        The checks run before the conversion, so that out of range values
+        cannot wrap around and floats cannot be truncated into valid codes.
 
         Args:
-            character_data (dict): A dictionary containing character data.
+            codes (array_like): The codes to check.
+            size (int): The number of valid codes.
+            argument (str): The argument name, used in error messages.
+
+        Returns:
+            numpy.ndarray: The codes as a contiguous int32 array.
+
+        Raises:
+            ValueError: If the codes are not integers or are out of range.
+        """
+        codes = np.asarray(codes)
+        if codes.size and not np.issubdtype(codes.dtype, np.integer):
+            raise ValueError("{} must be integers".format(argument))
+        if codes.size and (codes.min() < 0 or codes.max() >= size):
+            raise ValueError("{} must be between 0 and {}".format(argument, size - 1))
+        return np.ascontiguousarray(codes, np.int32)
+
+    def decode_symbols(self, symbol_ids):
+        """Converts symbol ids returned by `profile_characters_soa` to names.
+
+        Args:
+            symbol_ids (iterable): The symbol ids to decode.
 
         Returns:
-            dict: A dictionary with the astrological profile.
+            list: The corresponding symbol names.
         """
-        astro_data = character_data.get("AstrologicalData", {})
-        sign_name = astro_data.get("ZodiacSign")
-        if sign_name and sign_name in self.symbols["zodiac"]:
-            sign_info = self.symbols["zodiac"][sign_name]
-            return {
-                "Sign": sign_name,
-                "Element": sign_info.get("element"),
-                "Modality": sign_info.get("modality")
-            }
-        return {
-            "Sign": "Unknown",
-            "Element": "Unknown",
-            "Modality": "Unknown"
-        }
+        names = self._tables.symbol_names
+        return [names[i] for i in symbol_ids]
+
+    def decode_traits(self, trait_mask):
+        """Converts a personality trait mask to personality symbol names.
 
-    def _determine_name_symbol(self, character_data):
-        """Determines a symbol based on the meaning of the character's name.
+        The symbols are returned in the order their traits are declared in
+        the profiler's trait mapping, once per trait.
 
         Args:
-            character_data (dict): A dictionary containing character data.
+            trait_mask (int): A trait bitmask, such as an entry of the
+                "Personality" array returned by `profile_characters_soa`.
 
         Returns:
-            str: The name of the symbol.
+            list: The personality symbol names.
         """
-        name_map = {
-            "Star": "StarSymbol",
-            "Sun": "SunSymbol",
-        }
-        name_meaning = character_data.get("NameData", {}).get("NameMeaning")
-        symbol_name = name_map.get(name_meaning, "DefaultNameSymbol")
-        return self.symbols.get(symbol_name, {"name": "DefaultNameSymbol"}).get("name")
+        symbols_by_bit = self._tables.trait_symbols_by_bit
+        mask = int(trait_mask) & self._tables.valid_trait_mask
+        symbols = []
+        while mask:
+            lowest = mask & -mask
+            symbols.append(symbols_by_bit[lowest.bit_length() - 1])
+            mask ^= lowest
+        return symbols
+
+
+# The sidecar stores the output of the extraction code, so its version is a
+# fingerprint of that code and changes whenever the extraction does.
+_SIDECAR_VERSION = hashlib.sha1(b"".join(
+    marshal.dumps(method.__code__) for method in (
+        CharacterProfiler._index_sections, CharacterProfiler._find_section,
+        CharacterProfiler._extract_symbols))).hexdigest()
 
 
 if __name__ == "__main__":
@@ -252,17 +852,17 @@ if __name__ == "__main__":
 
     # 4. Print the profile in a readable format
     print("--- Character Profile for: {} ---".format(example_character["Name"]))
-    print("\nCore Symbol: {}".format(character_profile["Core"]))
-    print("Personality Symbols: {}".format(", ".join(character_profile["Personality"])))
-    print("Role Symbol: {}".format(character_profile["Role"]))
-    print("Name Symbol: {}".format(character_profile["Name"]))
+    print("\nCore Symbol: {}".format(character_profile.Core))
+    print("Personality Symbols: {}".format(", ".join(character_profile.Personality)))
+    print("Role Symbol: {}".format(character_profile.Role))
+    print("Name Symbol: {}".format(character_profile.Name))
 
-    astro_profile = character_profile["Astrology"]
+    astro_profile = character_profile.Astrology
     print("\nAstrological Profile:")
-    print("  Sign: {}".format(astro_profile["Sign"]))
-    print("  Element: {}".format(astro_profile["Element"]))
-    print("  Modality: {}".format(astro_profile["Modality"]))
+    print("  Sign: {}".format(astro_profile.Sign))
+    print("  Element: {}".format(astro_profile.Element))
+    print("  Modality: {}".format(astro_profile.Modality))
 
     print("\n--- Combined Symbolic Representation ---")
-    print(character_profile["Symbolic_Representation"])
+    print(character_profile.Symbolic_Representation)
     print("\n--- End of Profile ---")
@@ -1,7 +1,16 @@
 import unittest
 import json
 import os
-from character_profiler import CharacterProfiler
+import pickle
+import shutil
+import tempfile
+import copy
+import dataclasses
+import gc
+import importlib.util
+from unittest import mock
+import character_profiler
+from character_profiler import CharacterProfile, CharacterProfiler
 
 
 class TestCharacterProfiler(unittest.TestCase):
@@ -53,44 +62,303 @@ class TestCharacterProfiler(unittest.TestCase):
         profiler2 = CharacterProfiler(self.symbology_file)
         self.assertEqual(profiler1.symbology, profiler2.symbology)
         self.assertEqual(profiler1.symbols, profiler2.symbols)
-        
+
+    def test_sidecar_cache(self):
+        """Test that parsed symbology is reused across processes.
+
+        Verifies that the first instantiation writes a pickle sidecar next to
+        the symbology file and that a fresh process (simulated by clearing the
+        class-level caches) loads it instead of re-parsing the JSON.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            symbology_file = os.path.join(tmpdir, "symbology.jsonld")
+            shutil.copy(self.symbology_file, symbology_file)
+            try:
+                profiler1 = CharacterProfiler(symbology_file)
+                self.assertTrue(os.path.exists(symbology_file + ".cache.pkl"))
+
+                CharacterProfiler._symbology_cache.pop(symbology_file)
+                CharacterProfiler._symbols_cache.pop(symbology_file)
+                with mock.patch.object(character_profiler, "_load_json") as load:
+                    profiler2 = CharacterProfiler(symbology_file)
+                load.assert_not_called()
+                self.assertEqual(profiler1.symbology, profiler2.symbology)
+                self.assertEqual(profiler1.symbols, profiler2.symbols)
+            finally:
+                CharacterProfiler._symbology_cache.pop(symbology_file, None)
+                CharacterProfiler._symbols_cache.pop(symbology_file, None)
+                CharacterProfiler._sections_cache.pop(symbology_file, None)
+
+    def test_sidecar_cache_invalidation(self):
+        """Test that a sidecar is not reused once its source has changed.
+
+        Verifies that editing the symbology file invalidates the sidecar even
+        when the file's original modification time is restored afterwards.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            symbology_file = os.path.join(tmpdir, "symbology.jsonld")
+            shutil.copy(self.symbology_file, symbology_file)
+            try:
+                CharacterProfiler(symbology_file)
+                self.assertTrue(os.path.exists(symbology_file + ".cache.pkl"))
+
+                stat = os.stat(symbology_file)
+                with open(symbology_file) as f:
+                    symbology = json.load(f)
+                symbology["edited"] = True
+                with open(symbology_file, "w") as f:
+                    json.dump(symbology, f)
+                os.utime(symbology_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+                CharacterProfiler._symbology_cache.pop(symbology_file)
+                CharacterProfiler._symbols_cache.pop(symbology_file)
+                profiler = CharacterProfiler(symbology_file)
+                self.assertTrue(profiler.symbology["edited"])
+            finally:
+                CharacterProfiler._symbology_cache.pop(symbology_file, None)
+                CharacterProfiler._symbols_cache.pop(symbology_file, None)
+                CharacterProfiler._sections_cache.pop(symbology_file, None)
+
+    def test_cache_eviction(self):
+        """Test that cached symbology does not outlive its profilers.
+
+        Verifies that the class-level cache entries for a file survive while
+        it is the most recently profiled file, and disappear once the last
+        profiler using it is garbage collected and another file is profiled.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            symbology_file = os.path.join(tmpdir, "symbology.jsonld")
+            other_file = os.path.join(tmpdir, "other.jsonld")
+            shutil.copy(self.symbology_file, symbology_file)
+            shutil.copy(self.symbology_file, other_file)
+
+            profiler = CharacterProfiler(symbology_file)
+            self.assertIn(symbology_file, CharacterProfiler._symbology_cache)
+            self.assertIn(symbology_file, CharacterProfiler._symbols_cache)
+
+            del profiler
+            gc.collect()
+            self.assertIn(symbology_file, CharacterProfiler._symbology_cache)
+
+            CharacterProfiler(other_file)
+            gc.collect()
+            self.assertNotIn(symbology_file, CharacterProfiler._symbology_cache)
+            self.assertNotIn(symbology_file, CharacterProfiler._symbols_cache)
+            self.assertNotIn(symbology_file, CharacterProfiler._sections_cache)
+            self.assertNotIn(symbology_file, CharacterProfiler._tables_cache)
+
     def test_character_profiling(self):
         """Test the overall character profiling process.
 
-        Ensures that the profile_character method returns a dictionary
-        with the expected keys and that the data types are correct.
+        Ensures that the profile_character method returns a CharacterProfile
+        whose dictionary form has the expected keys and that the data types
+        are correct.
         """
         profiler = CharacterProfiler(self.symbology_file)
         profile = profiler.profile_character(self.test_character)
         
         expected_keys = ['Core', 'Personality', 'Role', 'Name', 'Astrology']
+        profile_dict = profile.as_dict()
         for key in expected_keys:
-            self.assertIn(key, profile)
+            self.assertIn(key, profile_dict)
             
-        self.assertIsInstance(profile['Personality'], list)
-        self.assertTrue(len(profile['Personality']) > 0)
+        self.assertIsInstance(profile, CharacterProfile)
+        self.assertIsInstance(profile.Personality, tuple)
+        self.assertTrue(len(profile.Personality) > 0)
+        self.assertEqual(profile_dict['Personality'], list(profile.Personality))
+        self.assertEqual(profile_dict['Astrology'],
+                         {"Sign": "Aries", "Element": "Fire", "Modality": "Cardinal"})
         
+    def test_profile_pickling_and_copying(self):
+        """Test that profiles survive pickling and copying.
+
+        Batch results are sent between processes by multiprocessing, so a
+        CharacterProfile must round-trip through pickle, copy and deepcopy.
+        """
+        profiler = CharacterProfiler(self.symbology_file)
+        profile = profiler.profile_character(self.test_character)
+
+        self.assertEqual(pickle.loads(pickle.dumps(profile)), profile)
+        self.assertEqual(copy.copy(profile), profile)
+        self.assertEqual(copy.deepcopy(profile), profile)
+
+    def test_profile_memoization(self):
+        """Test that repeated profiles are memoized safely.
+
+        Verifies that profiling the same character twice reuses the cached
+        profile, and that the shared profile cannot be modified by callers.
+        """
+        profiler = CharacterProfiler(self.symbology_file)
+        first = profiler.profile_character(self.test_character)
+        self.assertEqual(len(profiler._profile_cache), 1)
+
+        second = profiler.profile_character(dict(self.test_character))
+
+        self.assertEqual(len(profiler._profile_cache), 1)
+        self.assertIs(first, second)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            first.Core = "Square"
+
+    def test_profile_memoization_trait_containers(self):
+        """Test that memoized profiles match unmemoized ones.
+
+        A traits string and the list of its characters have the same tuple
+        form but profile differently, so neither may reuse the other's
+        cached profile.
+        """
+        profiler = CharacterProfiler(self.symbology_file)
+        as_string = profiler.profile_character({"PersonalityTraits": "Brave"})
+        as_list = profiler.profile_character({"PersonalityTraits": ["B", "r", "a", "v", "e"]})
+
+        self.assertEqual(as_string, profiler.profile_characters([{"PersonalityTraits": "Brave"}])[0])
+        self.assertEqual(as_list.Core, "Point")
+
+    def test_profiling_without_representation(self):
+        """Test that the symbolic representation can be skipped.
+
+        Ensures that include_representation=False leaves the representation
+        as None without changing any of the other profile fields.
+        """
+        profiler = CharacterProfiler(self.symbology_file)
+        full = profiler.profile_character(self.test_character)
+        bare = profiler.profile_character(self.test_character, include_representation=False)
+
+        self.assertIsInstance(full.Symbolic_Representation, str)
+        self.assertIsNone(bare.Symbolic_Representation)
+        self.assertEqual(dataclasses.replace(full, Symbolic_Representation=None), bare)
+
+    def test_profiling_without_framework_section(self):
+        """Test profiling against a symbology with no framework section.
+
+        With no symbols to resolve, the core symbol is None. The symbolic
+        representation must still be built, spelling it out as "None".
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            symbology_file = os.path.join(tmpdir, "empty.jsonld")
+            with open(symbology_file, "w") as f:
+                json.dump({"hasSection": []}, f)
+
+            profiler = CharacterProfiler(symbology_file)
+            profile = profiler.profile_character({"PersonalityTraits": ["Brave"], "Role": "Mage"})
+
+        self.assertIsNone(profile.Core)
+        self.assertEqual(profile.Symbolic_Representation,
+                         "Encapsulate(Superimpose(None, []), UnknownRole) "
+                         "AdjacentTo(Unknown, Unknown) Enclose(DefaultNameSymbol)")
+
+    def test_batch_profiling(self):
+        """Test that batch profiling matches per-character profiling.
+
+        Ensures that profile_characters returns one profile per input, in
+        order, identical to what profile_character returns for each.
+        """
+        profiler = CharacterProfiler(self.symbology_file)
+        characters = [
+            self.test_character,
+            {"Origin": "Earthly", "Role": "Warrior", "PersonalityTraits": ["Leader", "Wise"],
+             "AstrologicalData": {"ZodiacSign": "Pisces"}, "NameData": {"NameMeaning": "Sun"}},
+            {},
+        ]
+
+        profiles = profiler.profile_characters(characters)
+
+        self.assertEqual(len(profiles), len(characters))
+        for character, profile in zip(characters, profiles):
+            self.assertEqual(profile, profiler.profile_character(character))
+
+        profiles = profiler.profile_characters(characters, include_representation=False)
+        for character, profile in zip(characters, profiles):
+            self.assertEqual(profile, profiler.profile_character(character, include_representation=False))
+
+    @unittest.skipIf(importlib.util.find_spec("numpy") is None, "requires numpy")
+    def test_soa_batch_profiling(self):
+        """Test the integer-encoded structure-of-arrays batch profiler.
+
+        Verifies that the decoded symbols match profile_character, and that
+        out-of-range codes and trait masks are rejected instead of indexing
+        out of bounds or wrapping around.
+        """
+        import numpy as np
+
+        profiler = CharacterProfiler(self.symbology_file)
+        bits = character_profiler._TRAIT_BITS
+        warrior = {"Origin": "Earthly", "Role": "Warrior", "PersonalityTraits": ["Wise"],
+                   "NameData": {"NameMeaning": "Sun"}}
+
+        result = profiler.profile_characters_soa(
+            origin_ids=[character_profiler._ORIGIN_IDS["Celestial"], 0],
+            role_ids=[character_profiler._ROLE_IDS["Mage"], character_profiler._ROLE_IDS["Warrior"]],
+            name_ids=[character_profiler._NAME_IDS["Star"], character_profiler._NAME_IDS["Sun"]],
+            trait_masks=[bits["Brave"] | bits["Wise"] | bits["Mysterious"], bits["Wise"]])
+
+        for i, character in enumerate([self.test_character, warrior]):
+            expected = profiler.profile_character(character)
+            self.assertEqual(profiler.decode_symbols([result["Core"][i]]), [expected.Core])
+            self.assertEqual(profiler.decode_symbols([result["Role"][i]]), [expected.Role])
+            self.assertEqual(profiler.decode_symbols([result["Name"][i]]), [expected.Name])
+            self.assertEqual(profiler.decode_traits(result["Personality"][i]),
+                             list(expected.Personality))
+        self.assertEqual(result["Personality"][1], bits["Wise"])
+
+        with self.assertRaises(ValueError):
+            profiler.profile_characters_soa([0], [len(character_profiler._ROLE_IDS) + 1], [0], [0])
+        # Values that would wrap around or truncate to a valid int32 code.
+        with self.assertRaises(ValueError):
+            profiler.profile_characters_soa([2 ** 32], [0], [0], [0])
+        with self.assertRaises(ValueError):
+            profiler.profile_characters_soa([0.5], [0], [0], [0])
+        with self.assertRaises(ValueError):
+            profiler.profile_characters_soa([0], [0], [0], np.array([2 ** 32 + 1], np.int64))
+        with self.assertRaises(ValueError):
+            profiler.profile_characters_soa([0], [0], [0], [0.9])
+
+    @unittest.skipIf(importlib.util.find_spec("numpy") is None, "requires numpy")
+    def test_encoded_batch_scoring(self):
+        """Test encoding character dictionaries and scoring the arrays.
+
+        Ensures that encode_batch produces one entry per character and that
+        score_batch agrees with profile_character after decoding.
+        """
+        profiler = CharacterProfiler(self.symbology_file)
+        characters = [
+            self.test_character,
+            {"Role": "Warrior", "PersonalityTraits": ["Leader", "Leader", "Unknown"]},
+            {},
+        ]
+
+        encoded = profiler.encode_batch(characters)
+        self.assertEqual(sorted(encoded), ["name_id", "origin_id", "role_id", "trait_mask"])
+        for column in encoded.values():
+            self.assertEqual(len(column), len(characters))
+
+        scores = profiler.score_batch(encoded)
+        expected = [profiler.profile_character(c) for c in characters]
+        self.assertEqual(profiler.decode_symbols(scores["Core"]), [p.Core for p in expected])
+        self.assertEqual(profiler.decode_symbols(scores["Role"]), [p.Role for p in expected])
+        self.assertEqual(profiler.decode_symbols(scores["Name"]), [p.Name for p in expected])
+
     def test_personality_symbol_determination(self):
         """Test the determination of personality symbols.
 
-        Verifies that the _determine_personality_symbols method correctly
-        maps personality traits to symbols and handles various edge cases,
-        such as empty or invalid trait lists.
+        Verifies that profile_character correctly maps personality traits to
+        symbols, in trait order, and handles various edge cases, such as
+        empty or invalid trait lists.
         """
         profiler = CharacterProfiler(self.symbology_file)
         
         character_data = {"PersonalityTraits": ["Brave", "Wise"]}
-        symbols = profiler._determine_personality_symbols(character_data)
+        symbols = profiler.profile_character(character_data).Personality
         
-        self.assertIsInstance(symbols, list)
+        self.assertIsInstance(symbols, (list, tuple))
+        self.assertEqual(symbols, ("Triangle", "Spiral"))
         
         character_data = {"PersonalityTraits": []}
-        symbols = profiler._determine_personality_symbols(character_data)
-        self.assertEqual(symbols, [])
+        symbols = profiler.profile_character(character_data).Personality
+        self.assertEqual(symbols, ())
         
         character_data = {"PersonalityTraits": ["InvalidTrait"]}
-        symbols = profiler._determine_personality_symbols(character_data)
-        self.assertEqual(symbols, [])
+        symbols = profiler.profile_character(character_data).Personality
+        self.assertEqual(symbols, ())
 
 
 if __name__ == '__main__':